@@ -78,19 +78,19 @@ defmodule AriaBmesh.Face do
   Checks if the face is a triangle.
   """
   @spec triangle?(t()) :: boolean()
-  def triangle?(%__MODULE__{vertices: vertices}), do: length(vertices) == 3
+  def triangle?(%__MODULE__{vertices: vertices}), do: match?([_, _, _], vertices)
 
   @doc """
   Checks if the face is a quad.
   """
   @spec quad?(t()) :: boolean()
-  def quad?(%__MODULE__{vertices: vertices}), do: length(vertices) == 4
+  def quad?(%__MODULE__{vertices: vertices}), do: match?([_, _, _, _], vertices)
 
   @doc """
   Checks if the face is an n-gon (more than 4 vertices).
   """
   @spec ngon?(t()) :: boolean()
-  def ngon?(%__MODULE__{vertices: vertices}), do: length(vertices) > 4
+  def ngon?(%__MODULE__{vertices: vertices}), do: match?([_, _, _, _, _ | _], vertices)
 
   @doc """
   Gets a face attribute by name.
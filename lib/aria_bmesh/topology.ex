@@ -29,10 +29,8 @@ defmodule AriaBmesh.Topology do
   """
   @spec edge_loops(Mesh.t(), non_neg_integer()) :: [Loop.t()]
   def edge_loops(%Mesh{} = mesh, edge_id) do
-    # Find all loops that reference this edge
-    mesh.loops
-    |> Map.values()
-    |> Enum.filter(fn loop -> loop.edge == edge_id end)
+    # Find all loops that reference this edge (single pass over the map)
+    for {_id, %Loop{edge: ^edge_id} = loop} <- mesh.loops, do: loop
   end
 
   @doc """
@@ -63,9 +61,7 @@ defmodule AriaBmesh.Topology do
   """
   @spec vertex_faces(Mesh.t(), non_neg_integer()) :: [Face.t()]
   def vertex_faces(%Mesh{} = mesh, vertex_id) do
-    mesh.faces
-    |> Map.values()
-    |> Enum.filter(fn face -> vertex_id in face.vertices end)
+    for {_id, face} <- mesh.faces, vertex_id in face.vertices, do: face
   end
 
   @doc """
@@ -104,7 +100,7 @@ defmodule AriaBmesh.Topology do
         []
 
       [first_loop_id | _] ->
-        traverse_loop_ring(mesh, first_loop_id, MapSet.new())
+        traverse_loop_ring(mesh, first_loop_id, MapSet.new(), [])
     end
   end
 
@@ -138,7 +134,7 @@ defmodule AriaBmesh.Topology do
   """
   @spec edge_manifold?(Mesh.t(), Edge.t()) :: boolean()
   def edge_manifold?(%Mesh{} = _mesh, %Edge{} = edge) do
-    length(edge.faces) == 2
+    match?([_, _], edge.faces)
   end
 
   @doc """
@@ -153,7 +149,7 @@ defmodule AriaBmesh.Topology do
   """
   @spec edge_boundary?(Mesh.t(), Edge.t()) :: boolean()
   def edge_boundary?(%Mesh{} = _mesh, %Edge{} = edge) do
-    length(edge.faces) == 1
+    match?([_], edge.faces)
   end
 
   @doc """
@@ -168,35 +164,34 @@ defmodule AriaBmesh.Topology do
   """
   @spec edge_non_manifold?(Mesh.t(), Edge.t()) :: boolean()
   def edge_non_manifold?(%Mesh{} = _mesh, %Edge{} = edge) do
-    length(edge.faces) > 2
+    match?([_, _, _ | _], edge.faces)
   end
 
   # Private helper: Traverse loop ring using next pointers
   # Uses tombstones (visited set) to prevent infinite loops
-  defp traverse_loop_ring(%Mesh{} = mesh, loop_id, visited_ids) when is_nil(loop_id) do
-    # Reached end of chain, return empty list
-    []
+  # Tail-recursive: collects loops in an accumulator and reverses once at the end
+  defp traverse_loop_ring(%Mesh{} = _mesh, loop_id, _visited_ids, acc) when is_nil(loop_id) do
+    # Reached end of chain
+    Enum.reverse(acc)
   end
 
-  defp traverse_loop_ring(%Mesh{} = mesh, loop_id, visited_ids) do
+  defp traverse_loop_ring(%Mesh{} = mesh, loop_id, visited_ids, acc) do
     # Check tombstone: if we've already visited this loop, stop to prevent infinite loop
     if MapSet.member?(visited_ids, loop_id) do
-      # Cycle detected, return empty list to break the loop
-      []
+      # Cycle detected, stop traversal
+      Enum.reverse(acc)
     else
       case Mesh.get_loop(mesh, loop_id) do
         nil ->
           # Loop doesn't exist, stop traversal
-          []
+          Enum.reverse(acc)
 
         loop ->
           # Mark this loop as visited (tombstone)
           visited_set = MapSet.put(visited_ids, loop_id)
-          next_id = loop.next
 
           # Continue traversal with updated tombstone set
-          rest = traverse_loop_ring(mesh, next_id, visited_set)
-          [loop | rest]
+          traverse_loop_ring(mesh, loop.next, visited_set, [loop | acc])
       end
     end
   end